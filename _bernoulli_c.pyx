@@ -0,0 +1,43 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# AOT-compiled secant core for the prepared Bernoulli residual
+# f(v2) = a - coef*v2^2. Mirrors _secant_bernoulli_core in
+# bernoulli_solver.py; that pure-Python version is the fallback when this
+# extension is not built.
+
+from libc.math cimport fabs, NAN
+
+
+cdef inline double _residual(double v2, double a, double coef) nogil:
+    return a - coef*v2*v2
+
+
+def secant_method_c(double a, double coef, double x0, double x1,
+                    double tol, int max_iter, double[::1] xs, double[::1] fxs):
+    cdef double f_x1 = _residual(x1, a, coef)
+    cdef double slope, x_new
+    cdef int i
+
+    for i in range(max_iter):
+        xs[i] = x1
+        fxs[i] = f_x1
+
+        if fabs(f_x1) < tol:
+            return x1, i + 1, True
+
+        if i >= 3 and fabs(fxs[i-1]) > fabs(fxs[i-2]) and fabs(fxs[i]) > fabs(fxs[i-2]):
+            return NAN, i + 1, False
+
+        # Exact secant slope of the quadratic residual
+        slope = -coef * (x0 + x1)
+        if fabs(slope) < 1e-10:
+            return NAN, i + 1, False
+
+        x_new = x1 - f_x1 / slope
+        if x_new <= 0:
+            x_new = (x0 + x1) / 2
+
+        x0 = x1
+        x1 = x_new
+        f_x1 = _residual(x1, a, coef)
+
+    return x1, max_iter, False
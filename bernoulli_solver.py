@@ -1,13 +1,45 @@
+import functools
+import math
+
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    from _bernoulli_c import secant_method_c
+except ImportError:
+    secant_method_c = None
+
+@functools.lru_cache(maxsize=256)
+def _analytical_scalar(P1, P2, rho, g, h1, h2, v1):
+    # Returns (ok, value) rather than raising so failed inputs are cached
+    # like successful ones
+    term_under_sqrt = (2/rho) * (P1 - P2 + rho*g*(h1 - h2) + 0.5*rho*v1**2)
+    if term_under_sqrt < 0:
+        return False, term_under_sqrt
+    # math.sqrt skips the ufunc dispatch np.sqrt pays on a Python scalar
+    return True, math.sqrt(term_under_sqrt)
+
 def analytical_solution(P1, P2, rho, g, h1, h2, v1):
-    try:
-        term_under_sqrt = (2/rho) * (P1 - P2 + rho*g*(h1 - h2) + 0.5*rho*v1**2)
-        if term_under_sqrt < 0:
-            raise ValueError(f"No real solution exists (term under sqrt is negative: {term_under_sqrt:.2f})")
-        return np.sqrt(term_under_sqrt)
-    except Exception as e:
-        raise ValueError(f"Error in analytical solution: {str(e)}")
+    args = (P1, P2, rho, g, h1, h2, v1)
+    if all(np.isscalar(a) for a in args):
+        try:
+            ok, value = _analytical_scalar(*args)
+            if not ok:
+                raise ValueError(f"No real solution exists (term under sqrt is negative: {value:.2f})")
+            return value
+        except Exception as e:
+            raise ValueError(f"Error in analytical solution: {str(e)}")
+
+    # Array inputs: one vectorized pass, with a validity mask for cases
+    # with no real solution instead of raising
+    P1, P2, rho, g, h1, h2, v1 = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in args))
+    term = (2.0/rho) * (P1 - P2 + rho*g*(h1 - h2) + 0.5*rho*v1*v1)
+    valid = term >= 0
+    return np.sqrt(np.where(valid, term, np.nan)), valid
 
 def bernoulli_equation(v2, params):
     P1, P2, rho, g, h1, h2, v1 = params
@@ -16,41 +48,204 @@ def bernoulli_equation(v2, params):
     return ((P1 + 0.5*rho*v1**2 + rho*g*h1) - 
             (P2 + 0.5*rho*v2**2 + rho*g*h2)) / scale
 
+def _prep_bernoulli(params):
+    # Hoist everything in the residual that does not depend on v2:
+    # f(v2) = a - coef*v2^2 with a and coef computed once per solve
+    P1, P2, rho, g, h1, h2, v1 = params
+    scale = abs(P1) if abs(P1) > 1 else 1.0
+    lhs_const = P1 + 0.5*rho*v1*v1 + rho*g*h1 - P2 - rho*g*h2
+    return lhs_const / scale, 0.5*rho / scale
+
+def _secant_bernoulli_core(a, coef, x0, x1, tol, max_iter, xs, fxs):
+    # Bernoulli residual inlined as two FP ops, so the loop is pure
+    # scalar math that numba can compile
+    f_x1 = a - coef*x1*x1
+
+    for i in range(max_iter):
+        xs[i] = x1
+        fxs[i] = f_x1
+
+        if abs(f_x1) < tol:
+            return x1, i + 1, True
+
+        if i >= 3 and abs(fxs[i-1]) > abs(fxs[i-2]) and abs(fxs[i]) > abs(fxs[i-2]):
+            return np.nan, i + 1, False
+
+        # For the quadratic residual the secant slope (f1-f0)/(x1-x0)
+        # collapses exactly to -coef*(x0+x1): no finite difference, no
+        # catastrophic cancellation near the root
+        slope = -coef * (x0 + x1)
+        if abs(slope) < 1e-10:
+            return np.nan, i + 1, False
+
+        x_new = x1 - f_x1 / slope
+        if x_new <= 0:
+            x_new = (x0 + x1) / 2
+
+        x0, x1 = x1, x_new
+        f_x1 = a - coef*x1*x1
+
+    return x1, max_iter, False
+
+if njit is not None:
+    _secant_bernoulli_core = njit(cache=True, fastmath=True)(_secant_bernoulli_core)
+
+def secant_method_bernoulli(P1, P2, rho, g, h1, h2, v1, x0, x1, tol=1e-6, max_iter=100):
+    if x0 <= 0 or x1 <= 0:
+        raise ValueError("Initial guesses must be positive")
+
+    if abs(x1 - x0) < tol:
+        x1 = x0 * 1.1
+
+    xs = np.empty(max_iter)
+    fxs = np.empty(max_iter)
+    a, coef = _prep_bernoulli((P1, P2, rho, g, h1, h2, v1))
+    core = secant_method_c if secant_method_c is not None else _secant_bernoulli_core
+    root, n, converged = core(a, coef, x0, x1, tol, max_iter, xs, fxs)
+    if np.isnan(root):
+        root = None
+    return root, xs[:n], fxs[:n], converged
+
+def secant_method_vec(params, x0, x1, tol=1e-6, max_iter=100):
+    # Batched secant over N initial-guess pairs for convergence-basin /
+    # sensitivity sweeps: one vectorized residual evaluation per iteration,
+    # with fancy-indexed updates touching only still-active entries
+    x0 = np.atleast_1d(np.asarray(x0, dtype=float)).copy()
+    x1 = np.atleast_1d(np.asarray(x1, dtype=float)).copy()
+    if x0.shape != x1.shape:
+        x0, x1 = (arr.copy() for arr in np.broadcast_arrays(x0, x1))
+    if np.any(x0 <= 0) or np.any(x1 <= 0):
+        raise ValueError("Initial guesses must be positive")
+
+    a, coef = _prep_bernoulli(params)
+
+    close = np.abs(x1 - x0) < tol
+    x1[close] = x0[close] * 1.1
+
+    f_x0 = a - coef*x0*x0
+    f_x1 = a - coef*x1*x1
+
+    roots = np.full(x1.shape, np.nan)
+    converged = np.zeros(x1.shape, dtype=bool)
+    active = np.ones(x1.shape, dtype=bool)
+
+    for _ in range(max_iter):
+        done = active & (np.abs(f_x1) < tol)
+        roots[done] = x1[done]
+        converged[done] = True
+        active &= ~done
+        if not active.any():
+            break
+
+        # Degenerate slope deactivates an entry, like the scalar guards
+        dx = np.where(x1 != x0, x1 - x0, np.inf)
+        slope = (f_x1 - f_x0) / dx
+        active &= np.abs(slope) >= 1e-10
+
+        idx = np.flatnonzero(active)
+        x_new = x1[idx] - f_x1[idx] / slope[idx]
+        fallback = x_new <= 0
+        x_new[fallback] = (x0[idx][fallback] + x1[idx][fallback]) / 2
+
+        x0[idx] = x1[idx]
+        x1[idx] = x_new
+        f_x0[idx] = f_x1[idx]
+        f_x1[idx] = a - coef*x_new*x_new
+
+    return roots, converged
+
+def newton_method_bernoulli(params, x0, tol=1e-6, max_iter=20):
+    # f(v2) = a - coef*v2^2 has the cheap derivative f'(v2) = -2*coef*v2,
+    # so Newton converges in 1-2 steps where secant needs ~10
+    if x0 <= 0:
+        raise ValueError("Initial guess must be positive")
+
+    a, coef = _prep_bernoulli(params)
+    xs = np.empty(max_iter)
+    fxs = np.empty(max_iter)
+    v2 = x0
+    for i in range(max_iter):
+        f_v2 = a - coef*v2*v2
+        xs[i] = v2
+        fxs[i] = f_v2
+
+        if abs(f_v2) < tol:
+            return v2, xs[:i+1], fxs[:i+1], True
+
+        fprime = -2.0*coef*v2
+        if abs(fprime) < 1e-10:
+            return None, xs[:i+1], fxs[:i+1], False
+
+        v2_new = v2 - f_v2/fprime
+        if v2_new <= 0:
+            v2_new = v2 / 2
+
+        v2 = v2_new
+
+    return v2, xs, fxs, False
+
+def iteration_history(xs, fxs):
+    # Rebuild the (iteration, x, f(x)) tuple list only when needed for display
+    return [(i + 1, x, fx) for i, (x, fx) in enumerate(zip(xs, fxs))]
+
 def secant_method(f, x0, x1, params, tol=1e-6, max_iter=100):
-    iterations = []
     if x0 <= 0 or x1 <= 0:
         raise ValueError("Initial guesses must be positive")
-        
+
+    # SoA iteration history: two flat float arrays instead of a list of
+    # (iteration, x, f(x)) tuples
+    xs = np.empty(max_iter)
+    fxs = np.empty(max_iter)
+
     if abs(x1 - x0) < tol:
         x1 = x0 * 1.1
 
+    if f is bernoulli_equation:
+        # Evaluate the prepared two-op residual instead of re-deriving
+        # the constants on every call
+        a, coef = _prep_bernoulli(params)
+        def f_eval(v2):
+            return a - coef*v2*v2
+    else:
+        def f_eval(x):
+            return f(x, params)
+
+    # After each update the new f(x0) is the old f(x1), so carry both
+    # values across iterations: one residual call per iteration, not two
+    f_x0 = f_eval(x0)
+    f_x1 = f_eval(x1)
+
+    # Rolling window of the last three |f| values as plain scalars, so the
+    # oscillation check costs two comparisons and no array reads
+    fm2 = fm1 = math.inf
+
     for i in range(max_iter):
-        f_x0 = f(x0, params)
-        f_x1 = f(x1, params)
+        xs[i] = x1
+        fxs[i] = f_x1
+        fm0 = abs(f_x1)
 
-        iterations.append((i+1, x1, f_x1))
+        if fm0 < tol:
+            return x1, xs[:i+1], fxs[:i+1], True
 
-        if abs(f_x1) < tol:
-            return x1, iterations, True
+        if i >= 3 and fm1 > fm2 and fm0 > fm2:
+            return None, xs[:i+1], fxs[:i+1], False
 
         try:
             slope = (f_x1 - f_x0)/(x1 - x0)
-            if abs(slope) < 1e-10: 
-                return None, iterations, False
+            if abs(slope) < 1e-10:
+                return None, xs[:i+1], fxs[:i+1], False
 
             x_new = x1 - f_x1 * (x1 - x0)/(f_x1 - f_x0)
 
             if x_new <= 0:
-                x_new = (x0 + x1) / 2  
+                x_new = (x0 + x1) / 2
 
         except ZeroDivisionError:
-            return None, iterations, False
+            return None, xs[:i+1], fxs[:i+1], False
 
         x0, x1 = x1, x_new
+        f_x0 = f_x1
+        f_x1 = f_eval(x1)
+        fm2, fm1 = fm1, fm0
 
-        if len(iterations) > 3:
-            last_three = [abs(it[2]) for it in iterations[-3:]]
-            if all(e > last_three[0] for e in last_three[1:]):
-                return None, iterations, False
-
-    return x1, iterations, False
+    return x1, xs, fxs, False
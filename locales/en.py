@@ -0,0 +1,85 @@
+# UI strings, English
+
+L = {
+    "header": "Secant Method for the Bernoulli Equation",
+    "eq_heading": "Bernoulli Equation:",
+    "eq_caption": "Solving the Bernoulli Equation for the fluid velocity at point 2 ($v_2$).",
+
+    "err_density": "Density must be positive",
+    "err_velocity": "Velocity must be positive (non-negative)",
+    "err_pressure": "Pressure must be positive",
+
+    "sys_params": "System Parameters",
+    "fluid_props": "#### Fluid Properties",
+    "density_label": "Fluid Density (ρ) [kg/m³]",
+    "density_help": "Mass per unit volume of the fluid. [kg/m³]\nExamples:\n- Water: 1000 kg/m³\n- Air: 1.225 kg/m³",
+    "gravity_md": """
+            **Gravitational Acceleration (g)**: 9.81 m/s²
+            """,
+
+    "point1_params": "#### Parameters at point 1",
+    "p1_label": "Pressure at point 1 (P₁) [Pa]",
+    "p1_help": "Pressure at point 1 in Pascals [Pa]\nExamples:\n- Atmospheric pressure: 101325 Pa\n- 1 bar = 100000 Pa",
+    "h1_label": "Height at point 1 (h₁) [m]",
+    "h1_help": "Height at point 1 in meters [m]",
+    "v1_label": "Velocity at Point 1 (v₁) [m/s]",
+    "v1_help": "Fluid velocity at point 1 in mps [m/s]\nExample: 0.1 - 20 m/s for water flow",
+
+    "point2_params": "#### Parameters at point 2",
+    "p2_label": "Pressure at point 2 (P₂) [Pa]",
+    "p2_help": "Pressure at point 2 [Pa]\nExamples:\n- Atmospheric pressure: 101325 Pa\n- 1 bar = 100000 Pa",
+    "h2_label": "Height at point 2 (h₂) [m]",
+    "h2_help": "Height at point 2 [m]",
+
+    "secant_expander": "Secant Method Parameters",
+    "secant_md": """
+      ### Secant Method for v₂
+      The secant method needs two initial guesses for v₂ [m/s]. Good guesses help the error converge faster.
+
+    #### **Suggestions from physics:**
+    - By conservation of energy, v₂ should be similar to v₁.
+    - For a narrowing pipe, v₂ > v₁.
+    - For a widening pipe, v₂ < v₁.
+
+    #### **Recommended range:**
+    - Start with values close to v₁.
+    - Keep a reasonable spacing between the guesses.
+
+        """,
+    "guess1_label": "Guess 1 [m/s]",
+    "guess1_help": "First guess for v₂ in meters per second [m/s]",
+    "guess2_label": "Guess 2 [m/s]",
+    "guess2_help": "Second guess for v₂ in meters per second [m/s]",
+
+    "solve_button": "Numerical Solution",
+    "invalid_input": "Invalid input parameters: {message}",
+    "success": """
+                ✨ Solution found:
+                - Analytical: v₂ = {v2_analytical:.3f} m/s
+                - Numerical (Secant Method): v₂ = {v2_numerical:.3f} m/s
+                - Relative Error: {rel_error:.6f}%
+                """,
+
+    "tab_flow": "Fluid Flow Visualization",
+    "tab_convergence": "Error Plot (convergence)",
+    "tab_iterations": "Iteration Details",
+    "iteration_history_md": "#### Iteration History",
+
+    "no_convergence_md": """
+            ### The Numerical Method Did Not Converge
+
+            This may be caused by:
+            1. Initial guesses too far from the solution.
+            2. The problem being analyzed may not be physically realistic.
+            3. Numerical instability in the computation.
+
+            #### **Try the following:**
+            1. Use the suggested initial guesses.
+            2. Make sure the input parameters are physically sensible.
+            3. If you know the approximate answer, guess around that value.
+
+                """,
+    "guess_info": "Recommended guess value for v₂ ≈ {v2_analytical:.3f} m/s",
+    "calc_error": "Error in calculation: {error}",
+    "unexpected_error": "An unexpected error occurred: {error}",
+}
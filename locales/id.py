@@ -0,0 +1,85 @@
+# UI strings, Bahasa Indonesia
+
+L = {
+    "header": "Metode Secant untuk Persamaan Bernoulli",
+    "eq_heading": "Persamaan Bernoulli:",
+    "eq_caption": "Menyelesaikan Persamaan Bernoulli untuk mencari kecepatan fluida pada titik 2 ($v_2$).",
+
+    "err_density": "Nilai Densitas Harus Positif",
+    "err_velocity": "Kecepatan Harus Positif (non-negative)",
+    "err_pressure": "Tekanan harus Positif",
+
+    "sys_params": "Parameter Sistem",
+    "fluid_props": "#### Sifat Fluida",
+    "density_label": "Densitas Fluida (ρ) [kg/m³]",
+    "density_help": "Massa per satuan volume fluida. [kg/m³]\nContoh:\n- Air: 1000 kg/m³\n- Udara: 1.225 kg/m³",
+    "gravity_md": """
+            **Percepatan Gravitasi (g)**: 9.81 m/s²
+            """,
+
+    "point1_params": "#### Parameter pada titik 1",
+    "p1_label": "Tekanan pada titik 1 (P₁) [Pa]",
+    "p1_help": "Tekanan pada titik 1 dalam Pascals [Pa]\nContoh:\n- Tekanan Atmosfer: 101325 Pa\n- 1 bar = 100000 Pa",
+    "h1_label": "Ketinggian pada titik 1 (h₁) [m]",
+    "h1_help": "Ketinggian pada titik 1 dalam meter [m]",
+    "v1_label": "Velocity at Point 1 (v₁) [m/s]",
+    "v1_help": "Kecepatan fluida pada titik 1 dalam mps [m/s]\contoh: 0.1 - 20 m/s untuk aliran air",
+
+    "point2_params": "#### Parameter pada titik 2",
+    "p2_label": "Tekanan pada titik 2 (P₂) [Pa]",
+    "p2_help": "Tekanan pada titik 2 [Pa]\nContoh:\n- Tekanan atmosfer: 101325 Pa\n- 1 bar = 100000 Pa",
+    "h2_label": "Ketinggian pada titik 2 (h₂) [m]",
+    "h2_help": "Ketinggian pada titik 2 [m]",
+
+    "secant_expander": "Parameter Metode Secant",
+    "secant_md": """
+      ### Metode Secant untuk v₂
+      Metode secant memerlukan dua tebakan awal untuk v₂ [m/s]. Tebakan yang baik membantu nilai error konvergen lebih cepat.
+
+    #### **Saran secara hukum fisika:**
+    - Berdasarkan hukum kekekalan energi, v₂ seharusnya mirip dengan v₁.
+    - Untuk pipa yang menyempit, v₂ > v₁.
+    - Untuk pipa yang melebar, v₂ < v₁.
+
+    #### **Rentang yang direkomendasikan:**
+    - Mulailah dengan nilai yang mendekati v₁.
+    - Pastikan perkiraan memiliki jarak yang cukup masuk akal.
+
+        """,
+    "guess1_label": "Tebakan 1 [m/s]",
+    "guess1_help": "Tebakan 1 untuk nilai v₂ dalam meters per second [m/s]",
+    "guess2_label": "Tebakan 2 [m/s]",
+    "guess2_help": "Tebakan 2 untuk nilai v₂ dalam meters per second [m/s]",
+
+    "solve_button": "Solusi Numerik",
+    "invalid_input": "Invalid input parameters: {message}",
+    "success": """
+                ✨ Solusi didapatkan:
+                - Analitik: v₂ = {v2_analytical:.3f} m/s
+                - Numerik (Metode Secant): v₂ = {v2_numerical:.3f} m/s
+                - Error Relatif: {rel_error:.6f}%
+                """,
+
+    "tab_flow": "Visualisasi Aliran Fluida",
+    "tab_convergence": "Grafik Error (konvergensi)",
+    "tab_iterations": "Detail Iterasi",
+    "iteration_history_md": "#### Iteration History",
+
+    "no_convergence_md": """
+            ### Metode Numerik Tidak Mencapai Konvergensi
+
+            Hal ini mungkin disebabkan oleh:
+            1. Tebakan awal terlalu jauh dari solusi.
+            2. Masalah yang dianalisis mungkin tidak realistis secara fisika.
+            3. Ketidakstabilan numerik dalam perhitungan.
+
+            #### **Coba langkah berikut:**
+            1. Gunakan tebakan awal yang disarankan.
+            2. Pastikan parameter input yang digunakan masuk akal secara fisika.
+            3. Jika Anda mengetahui perkiraan jawabannya, gunakan tebakan di sekitar nilai tersebut.
+
+                """,
+    "guess_info": "Rekomendasi nilai tebakan untuk v₂ ≈ {v2_analytical:.3f} m/s",
+    "calc_error": "Error in calculation: {error}",
+    "unexpected_error": "An unexpected error occurred: {error}",
+}
@@ -1,12 +1,13 @@
+import functools
+
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-from bernoulli_solver import bernoulli_equation, secant_method, analytical_solution
+from bernoulli_solver import bernoulli_equation, secant_method, analytical_solution, newton_method_bernoulli, iteration_history
+from locales import en, id
 
 st.set_page_config(page_title="Solusi Numerik Persamaan Bernoulli", layout="wide")
 
-def create_equation_section():
-    st.header("Metode Secant untuk Persamaan Bernoulli")
+def create_equation_section(L):
+    st.header(L["header"])
     st.markdown("""
     <style>
     .equation {
@@ -19,27 +20,26 @@ def create_equation_section():
     </style>
     """, unsafe_allow_html=True)
 
-    st.markdown("""
+    st.markdown(f"""
     <div class="equation">
-    <h3>Persamaan Bernoulli:</h3>
+    <h3>{L["eq_heading"]}</h3>
     </div>
     """, unsafe_allow_html=True)
 
     st.latex(r"P_1 + \frac{1}{2}\rho v_1^2 + \rho gh_1 = P_2 + \frac{1}{2}\rho v_2^2 + \rho gh_2")
 
-    st.markdown("""
-    Menyelesaikan Persamaan Bernoulli untuk mencari kecepatan fluida pada titik 2 ($v_2$).
-    """)
+    st.markdown(L["eq_caption"])
 
-def validate_inputs(P1, P2, rho, g, h1, h2, v1):
+def validate_inputs(P1, P2, rho, g, h1, h2, v1, L):
     if rho <= 0:
-        return False, "Nilai Densitas Harus Positif"
+        return False, L["err_density"]
     if v1 < 0:
-        return False, "Kecepatan Harus Positif (non-negative)"
+        return False, L["err_velocity"]
     if P1 < 0 or P2 < 0:
-        return False, "Tekanan harus Positif"
+        return False, L["err_pressure"]
     return True, ""
 
+@functools.lru_cache(maxsize=256)
 def suggest_initial_guesses(v1, P1, P2, rho, g, h1, h2):
     try:
         v2_analytical = analytical_solution(P1, P2, rho, g, h1, h2, v1)
@@ -48,63 +48,61 @@ def suggest_initial_guesses(v1, P1, P2, rho, g, h1, h2):
         # If analytical solution fails, use v1-based guesses
         return max(0.1, v1 * 0.5), min(v1 * 1.5, 20.0)
 
-def create_input_section():
+def create_input_section(L):
     with st.container():
-        st.subheader("Parameter Sistem")
+        st.subheader(L["sys_params"])
 
         # Fluid properties
         col1, col2 = st.columns(2)
         with col1:
-            st.markdown("#### Sifat Fluida")
+            st.markdown(L["fluid_props"])
             rho = st.number_input(
-                "Densitas Fluida (ρ) [kg/m³]",
+                L["density_label"],
                 value=1000.0,
                 min_value=0.1,
-                help="Massa per satuan volume fluida. [kg/m³]\nContoh:\n- Air: 1000 kg/m³\n- Udara: 1.225 kg/m³",
+                help=L["density_help"],
                 format="%.1f"
             )
         with col2:
             g = 9.81  # gravitational acceleration
-            st.markdown("""
-            **Percepatan Gravitasi (g)**: 9.81 m/s²
-            """)
+            st.markdown(L["gravity_md"])
 
         # Point 1 and 2 parameters
         col1, col2 = st.columns(2)
         with col1:
-            st.markdown("#### Parameter pada titik 1")
+            st.markdown(L["point1_params"])
             P1 = st.number_input(
-                "Tekanan pada titik 1 (P₁) [Pa]",
+                L["p1_label"],
                 value=101325.0,
-                help="Tekanan pada titik 1 dalam Pascals [Pa]\nContoh:\n- Tekanan Atmosfer: 101325 Pa\n- 1 bar = 100000 Pa",
+                help=L["p1_help"],
                 format="%.1f"
             )
             h1 = st.number_input(
-                "Ketinggian pada titik 1 (h₁) [m]",
+                L["h1_label"],
                 value=0.0,
-                help="Ketinggian pada titik 1 dalam meter [m]",
+                help=L["h1_help"],
                 format="%.2f"
             )
             v1 = st.number_input(
-                "Velocity at Point 1 (v₁) [m/s]",
+                L["v1_label"],
                 value=2.0,
                 min_value=0.0,
-                help="Kecepatan fluida pada titik 1 dalam mps [m/s]\contoh: 0.1 - 20 m/s untuk aliran air",
+                help=L["v1_help"],
                 format="%.2f"
             )
 
         with col2:
-            st.markdown("#### Parameter pada titik 2")
+            st.markdown(L["point2_params"])
             P2 = st.number_input(
-                "Tekanan pada titik 2 (P₂) [Pa]",
+                L["p2_label"],
                 value=101325.0,
-                help="Tekanan pada titik 2 [Pa]\nContoh:\n- Tekanan atmosfer: 101325 Pa\n- 1 bar = 100000 Pa",
+                help=L["p2_help"],
                 format="%.1f"
             )
             h2 = st.number_input(
-                "Ketinggian pada titik 2 (h₂) [m]",
+                L["h2_label"],
                 value=1.0,
-                help="Ketinggian pada titik 2 [m]",
+                help=L["h2_help"],
                 format="%.2f"
             )
 
@@ -112,66 +110,56 @@ def create_input_section():
     suggested_x0, suggested_x1 = suggest_initial_guesses(v1, P1, P2, rho, g, h1, h2)
 
     # Numerical method parameters in an expander
-    with st.expander("Parameter Metode Secant", expanded=False):
-        st.markdown("""
-      ### Metode Secant untuk v₂  
-      Metode secant memerlukan dua tebakan awal untuk v₂ [m/s]. Tebakan yang baik membantu nilai error konvergen lebih cepat.  
-
-    #### **Saran secara hukum fisika:**  
-    - Berdasarkan hukum kekekalan energi, v₂ seharusnya mirip dengan v₁.  
-    - Untuk pipa yang menyempit, v₂ > v₁.  
-    - Untuk pipa yang melebar, v₂ < v₁.  
-
-    #### **Rentang yang direkomendasikan:**  
-    - Mulailah dengan nilai yang mendekati v₁.  
-    - Pastikan perkiraan memiliki jarak yang cukup masuk akal.  
-
-        """)
+    with st.expander(L["secant_expander"], expanded=False):
+        st.markdown(L["secant_md"])
 
         col1, col2 = st.columns(2)
         with col1:
             x0 = st.number_input(
-                "Tebakan 1 [m/s]",
+                L["guess1_label"],
                 value=suggested_x0,
                 min_value=0.1,
-                help="Tebakan 1 untuk nilai v₂ dalam meters per second [m/s]",
+                help=L["guess1_help"],
                 format="%.2f"
             )
         with col2:
             x1 = st.number_input(
-                "Tebakan 2 [m/s]",
+                L["guess2_label"],
                 value=suggested_x1,
                 min_value=0.1,
-                help="Tebakan 2 untuk nilai v₂ dalam meters per second [m/s]",
+                help=L["guess2_help"],
                 format="%.2f"
             )
 
     return P1, P2, rho, g, h1, h2, v1, x0, x1
 
-def plot_convergence(iterations):
-    fig, ax = plt.subplots(figsize=(10, 6))
-    iterations_array = np.array(iterations)
-
-    ax.semilogy([i[0] for i in iterations], 
-                [abs(i[2]) for i in iterations], 
-                'b.-', linewidth=2, markersize=8)
-
-    ax.set_xlabel('Iteration Number')
-    ax.set_ylabel('Absolute Error |f(x)|')
-    ax.set_title('Convergence History')
-    ax.grid(True, which="both", ls="-", alpha=0.2)
-
-    # Add points and annotations
-    for i, (iter_num, x_val, fx_val) in enumerate(iterations):
-        ax.annotate(f'v₂ = {x_val:.2f}',
-                   (iter_num, abs(fx_val)),
-                   textcoords="offset points",
-                   xytext=(0,10),
-                   ha='center')
-
-    return fig
+def convergence_chart(iter_x, iter_fx):
+    # Vega-Lite spec rendered in the browser: no server-side AGG
+    # rasterization or PNG encoding like the old matplotlib figure, and
+    # tooltips replace the per-point annotations
+    import altair as alt
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame({
+        "iteration": np.arange(1, len(iter_x) + 1),
+        "v2": iter_x,
+        # Floor at tiny positive so an exact zero survives the log scale
+        "error": np.maximum(np.abs(iter_fx), 1e-16),
+    })
+    return alt.Chart(df).mark_line(point=True).encode(
+        x=alt.X("iteration", title="Iteration Number"),
+        y=alt.Y("error", title="Absolute Error |f(x)|",
+                scale=alt.Scale(type="log")),
+        tooltip=["iteration", "v2", "error"],
+    )
 
 def plot_flow_visualization(h1, h2, v1, v2):
+    # Imported lazily so the ~200ms matplotlib import is paid only when a
+    # figure is actually built, not on Streamlit cold start
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     fig, ax = plt.subplots(figsize=(12, 6))
 
     # Plot pipe
@@ -185,17 +173,16 @@ def plot_flow_visualization(h1, h2, v1, v2):
     arrow_density = 20
     x_points = np.linspace(x1, x2, arrow_density)
 
-    for x in x_points:
-        y = h1 + (h2-h1)*(x-x1)/(x2-x1)
-        dx = 0.2
-        dy = 0.1
-
-        # Scale arrow size with velocity
-        v_local = v1 + (v2-v1)*(x-x1)/(x2-x1)
-        scale = v_local / max(v1, v2)
+    # One vectorized quiver collection instead of one arrow patch per point,
+    # with arrow length scaled by the local velocity
+    y_points = h1 + (h2-h1)*(x_points-x1)/(x2-x1)
+    v_local = v1 + (v2-v1)*(x_points-x1)/(x2-x1)
+    scale = v_local / max(v1, v2)
+    u = 0.2*scale
+    v = 0.1*(h2-h1)/(x2-x1)*np.ones_like(x_points)
 
-        ax.arrow(x, y, dx*scale, dy*(h2-h1)/(x2-x1), 
-                head_width=0.1, head_length=0.1, fc='blue', ec='blue', alpha=0.6)
+    ax.quiver(x_points, y_points, u, v, angles='xy', scale_units='xy', scale=1,
+              color='blue', alpha=0.6, width=0.005)
 
     # Add velocity labels
     ax.text(x1, h1+0.5, f'v₁ = {v1:.2f} m/s', ha='center')
@@ -214,49 +201,74 @@ def plot_flow_visualization(h1, h2, v1, v2):
 
     return fig
 
+@st.cache_data
+def _solve(P1, P2, rho, g, h1, h2, v1, x0, x1):
+    # Memoized on the input tuple so tab switches and unrelated widget
+    # edits don't re-trigger the solve
+    v2_analytical = analytical_solution(P1, P2, rho, g, h1, h2, v1)
+
+    params = (P1, P2, rho, g, h1, h2, v1)
+    f = bernoulli_equation
+    if f is bernoulli_equation:
+        # The residual is quadratic in v2, so Newton with the analytic
+        # derivative converges in 1-2 steps - no secant loop needed
+        v2_numerical, iters_x, iters_fx, converged = newton_method_bernoulli(params, x0)
+    else:
+        v2_numerical, iters_x, iters_fx, converged = secant_method(f, x0, x1, params)
+
+    return v2_analytical, v2_numerical, iters_x, iters_fx, converged
+
+@st.cache_resource
+def _flow_figure(h1, h2, v1, v2):
+    return plot_flow_visualization(h1, h2, v1, v2)
+
 def main():
-    create_equation_section()
-    P1, P2, rho, g, h1, h2, v1, x0, x1 = create_input_section()
+    # Single source of truth for the UI strings: one main.py parameterized
+    # on a locale dict instead of duplicated translated modules
+    lang = st.sidebar.selectbox(
+        "Language / Bahasa",
+        ("id", "en"),
+        format_func=lambda code: "Bahasa Indonesia" if code == "id" else "English"
+    )
+    L = en.L if lang == "en" else id.L
+
+    create_equation_section(L)
+    P1, P2, rho, g, h1, h2, v1, x0, x1 = create_input_section(L)
 
     # Solve button with custom styling
-    solve_button = st.button("Solusi Numerik", type="primary")
+    solve_button = st.button(L["solve_button"], type="primary")
 
     if solve_button:
         # Validate inputs first
-        valid, message = validate_inputs(P1, P2, rho, g, h1, h2, v1)
+        valid, message = validate_inputs(P1, P2, rho, g, h1, h2, v1, L)
         if not valid:
-            st.error(f"Invalid input parameters: {message}")
+            st.error(L["invalid_input"].format(message=message))
             return
 
         try:
-            # Try analytical solution first
-            v2_analytical = analytical_solution(P1, P2, rho, g, h1, h2, v1)
-
-            # Calculate numerical solution
-            params = (P1, P2, rho, g, h1, h2, v1)
-            v2_numerical, iterations, converged = secant_method(bernoulli_equation, x0, x1, params)
+            v2_analytical, v2_numerical, iters_x, iters_fx, converged = _solve(
+                P1, P2, rho, g, h1, h2, v1, x0, x1)
 
             if converged and v2_numerical is not None:
-                st.success(f"""
-                ✨ Solusi didapatkan:
-                - Analitik: v₂ = {v2_analytical:.3f} m/s
-                - Numerik (Metode Secant): v₂ = {v2_numerical:.3f} m/s
-                - Error Relatif: {abs(v2_analytical - v2_numerical)/v2_analytical*100:.6f}%
-                """)
+                st.success(L["success"].format(
+                    v2_analytical=v2_analytical,
+                    v2_numerical=v2_numerical,
+                    rel_error=abs(v2_analytical - v2_numerical)/v2_analytical*100))
 
                 # Create tabs for different visualizations
-                tab1, tab2, tab3 = st.tabs(["Visualisasi Aliran Fluida", "Grafik Error (konvergensi)", "Detail Iterasi"])
+                tab1, tab2, tab3 = st.tabs([L["tab_flow"], L["tab_convergence"], L["tab_iterations"]])
 
                 with tab1:
-                    st.pyplot(plot_flow_visualization(h1, h2, v1, v2_numerical))
+                    st.pyplot(_flow_figure(h1, h2, v1, v2_numerical))
 
                 with tab2:
-                    st.pyplot(plot_convergence(iterations))
+                    st.altair_chart(convergence_chart(iters_x, iters_fx),
+                                    use_container_width=True)
 
                 with tab3:
-                    st.markdown("#### Iteration History")
+                    st.markdown(L["iteration_history_md"])
                     iteration_data = []
-                    for i, x, fx in iterations:
+                    for i, x, fx in iteration_history(iters_x, iters_fx):
                         iteration_data.append({
                             "Iteration": i,
                             "v₂ Value (m/s)": f"{x:.6f}",
@@ -264,28 +276,15 @@ def main():
                         })
                     st.table(iteration_data)
             else:
-                st.error("""
-            ### Metode Numerik Tidak Mencapai Konvergensi  
-
-            Hal ini mungkin disebabkan oleh:  
-            1. Tebakan awal terlalu jauh dari solusi.  
-            2. Masalah yang dianalisis mungkin tidak realistis secara fisika.  
-            3. Ketidakstabilan numerik dalam perhitungan.  
-
-            #### **Coba langkah berikut:**  
-            1. Gunakan tebakan awal yang disarankan.  
-            2. Pastikan parameter input yang digunakan masuk akal secara fisika.  
-            3. Jika Anda mengetahui perkiraan jawabannya, gunakan tebakan di sekitar nilai tersebut.  
-
-                """)
+                st.error(L["no_convergence_md"])
 
                 # Show analytical solution anyway if available
-                st.info(f"Rekomendasi nilai tebakan untuk v₂ ≈ {v2_analytical:.3f} m/s")
+                st.info(L["guess_info"].format(v2_analytical=v2_analytical))
 
         except ValueError as e:
-            st.error(f"Error in calculation: {str(e)}")
+            st.error(L["calc_error"].format(error=str(e)))
         except Exception as e:
-            st.error(f"An unexpected error occurred: {str(e)}")
+            st.error(L["unexpected_error"].format(error=str(e)))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,14 @@
+# Optional build of the Cython secant core (_bernoulli_c.pyx) for
+# deployments where numba's LLVM dependency is undesirable:
+#
+#   pip install cython && python setup.py build_ext --inplace
+#
+# The app runs fine without it; bernoulli_solver falls back to the
+# pure-Python (or numba-jitted) core when the extension is missing.
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="secant-method",
+    ext_modules=cythonize("_bernoulli_c.pyx"),
+)